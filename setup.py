@@ -1,6 +1,11 @@
 """Setup script for preservationeval."""
 
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -14,6 +19,160 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+PROJECT_ROOT = Path(__file__).resolve().parent
+TABLES_MODULE_PATH = PROJECT_ROOT / "src" / "preservationeval" / "tables.py"
+VERSION_FILE_PATH = PROJECT_ROOT / "src" / "preservationeval" / "_version.py"
+SKIP_TABLE_BUILD_ENV = "PRESERVATIONEVAL_SKIP_TABLE_BUILD"
+
+
+def read_version_file() -> str | None:
+    """Read the version from _version.py without importing preservationeval.
+
+    Importing preservationeval._version would run the package __init__, which
+    loads numpy and the lookup tables on every setup.py invocation.
+
+    Returns:
+        Version string, or None if the file is missing or malformed
+    """
+    try:
+        content = VERSION_FILE_PATH.read_text()
+    except OSError:
+        return None
+    match = re.search(r'^version = "(.+)"$', content, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def _tables_cache_dir() -> Path:
+    """Return the cache directory for tables built by the current generator.
+
+    The directory is keyed on the dp.js URL and a hash of the table generator
+    sources, so a changed generator starts with an empty cache.
+
+    Returns:
+        Directory holding the cached tables module and dp.js validators
+    """
+    from preservationeval.install.const import DP_JS_URL
+
+    key = hashlib.sha256(DP_JS_URL.encode())
+    for source in sorted((TABLES_MODULE_PATH.parent / "install").glob("*.py")):
+        key.update(source.read_bytes())
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "preservationeval" / key.hexdigest()[:16]
+
+
+def _read_cached_validators(cache_dir: Path) -> dict[str, str]:
+    """Return the ETag / Last-Modified of the dp.js the cached tables came from.
+
+    Args:
+        cache_dir: Cache directory, see _tables_cache_dir
+
+    Returns:
+        Validators by header name, empty if there is no usable cache entry
+    """
+    if not (cache_dir / "tables.py").is_file():
+        return {}
+    try:
+        validators = json.loads((cache_dir / "validators.json").read_text())
+    except (OSError, ValueError):
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def _fetch_dpjs(validators: dict[str, str]) -> tuple[str | None, dict[str, str]]:
+    """Download dp.js unless it is unchanged since the cached version.
+
+    Args:
+        validators: ETag / Last-Modified of the cached dp.js, sent as a
+            conditional request
+
+    Returns:
+        Tuple of the dp.js source, or None if the server reports it unchanged,
+        and the validators of that dp.js version
+
+    Raises:
+        requests.RequestException: If dp.js cannot be downloaded
+    """
+    import requests
+
+    from preservationeval.install.const import DP_JS_URL
+
+    headers = {}
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+
+    response = requests.get(DP_JS_URL, headers=headers, timeout=10)
+    if response.status_code == requests.codes.not_modified:
+        return None, validators
+    response.raise_for_status()
+    return response.text, {
+        name: response.headers[name]
+        for name in ("ETag", "Last-Modified")
+        if name in response.headers
+    }
+
+
+def _store_cached_tables(cache_dir: Path, validators: dict[str, str]) -> None:
+    """Store the generated tables module with the validators of its dp.js.
+
+    The tables module is written before the validators, so an interrupted
+    write leaves validators that no longer match and the next build simply
+    downloads dp.js again.
+
+    Args:
+        cache_dir: Cache directory, see _tables_cache_dir
+        validators: ETag / Last-Modified of the dp.js the tables came from
+    """
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / "validators.json").unlink(missing_ok=True)
+        tmp_path = cache_dir / "tables.py.tmp"
+        shutil.copyfile(TABLES_MODULE_PATH, tmp_path)
+        tmp_path.replace(cache_dir / "tables.py")
+        (cache_dir / "validators.json").write_text(json.dumps(validators))
+    except OSError as e:
+        logger.warning(f"Could not cache preservationeval.tables: {e}")
+
+
+def generate_tables_module() -> None:
+    """Generate the preservationeval.tables module from dp.js.
+
+    Generated tables are cached in the user cache directory together with
+    the ETag / Last-Modified of their dp.js. dp.js is then requested
+    conditionally, and if the server reports it unchanged the cached tables
+    are used without downloading or parsing dp.js.
+    """
+    # Add src to Python path temporarily, unless it is importable already
+    src_path = str(PROJECT_ROOT / "src")
+    inserted = src_path not in sys.path
+    if inserted:
+        sys.path.insert(0, src_path)
+
+    try:
+        cache_dir = _tables_cache_dir()
+        js_content, validators = _fetch_dpjs(_read_cached_validators(cache_dir))
+        if js_content is None:
+            logger.info(f"dp.js unchanged, using cached tables from {cache_dir}")
+            shutil.copyfile(cache_dir / "tables.py", TABLES_MODULE_PATH)
+            return
+
+        from preservationeval.install.generate_tables import generate_tables
+
+        generate_tables(js_content=js_content)
+
+        # Without validators a later build could not tell if dp.js changed
+        if validators:
+            _store_cached_tables(cache_dir, validators)
+    except Exception as e:
+        logger.error(f"Error generating preservationeval.tables: {e}")
+        raise  # This will cause the build to fail
+
+    finally:
+        # Remove src from path
+        if inserted:
+            sys.path.remove(src_path)
+
 
 class CustomDistribution(Distribution):
     """Custom distribution for preservationeval.
@@ -55,67 +214,48 @@ class CustomDistribution(Distribution):
 
     def _write_version_file(self) -> None:
         """Write version string to src/preservationeval/_version.py."""
-        src_path = Path(__file__).resolve().parent / "src"
-        sys.path.insert(0, str(src_path))
-
-        try:
-            from preservationeval._version import version as file_version
-        except ImportError:
-            file_version = "unknown"
+        file_version = read_version_file()
+        # Always leave a version file behind, so the version can be read from
+        # it statically instead of by importing the package
+        version = self._get_git_version() or file_version or "0.0.0"
 
-        git_version = self._get_git_version()
-
-        if git_version is not None and git_version != file_version:
-            version_file = src_path / "preservationeval" / "_version.py"
+        if version != file_version:
             try:
-                with version_file.open("w") as f:
-                    f.write(f'version = "{git_version}"\n')
+                with VERSION_FILE_PATH.open("w") as f:
+                    f.write(f'version = "{version}"\n')
             except OSError:
-                logger.error(f"Failed to write version file: {version_file}")
+                logger.error(f"Failed to write version file: {VERSION_FILE_PATH}")
 
     def _get_version(self) -> str:
         """Read the version from the generated _version.py file."""
-        src_path = Path(__file__).resolve().parent / "src"
-        sys.path.insert(0, str(src_path))
-
-        try:
-            from preservationeval._version import version
-
-            return str(version)
-        except ImportError:
-            logger.warning("Failed to import version from _version.py")
+        version = read_version_file()
+        if version is None:
+            logger.warning("Failed to read version from _version.py")
             return "0.0.0"  # fallback version
-        finally:
-            sys.path.pop(0)  # Remove the temporarily added path
+        return version
 
 
 class CustomBuildPy(build_py):
     """Custom build command that generates lookup tables during build."""
 
     def _generate_tables(self) -> None:
-        """Generate lookup tables for preservationeval."""
-        # Add src to Python path temporarily
-        src_path = Path(__file__).resolve().parent / "src"
-        sys.path.insert(0, str(src_path))
-
-        try:
-            if not self.dry_run:
-                from preservationeval.install.generate_tables import generate_tables
+        """Generate lookup tables for preservationeval.
 
-                generate_tables()
-        except Exception as e:
-            logger.error(f"Error generating preservationeval.tables: {e}")
-            raise  # This will cause the build to fail
-
-        finally:
-            # Remove src from path
-            sys.path.pop(0)
+        Setting PRESERVATIONEVAL_SKIP_TABLE_BUILD=1 reuses an existing tables
+        module, e.g. for repeated editable installs.
+        """
+        if TABLES_MODULE_PATH.is_file() and os.environ.get(SKIP_TABLE_BUILD_ENV) == "1":
+            logger.info(f"{SKIP_TABLE_BUILD_ENV}=1, using existing tables")
+            return
+        if not self.dry_run:
+            generate_tables_module()
 
     def run(self) -> None:
         """Run the build command with table generation.
 
         This command performs the following steps:
-        1. Generates preservation lookup tables (PI, EMC, Mold)
+        1. Generates preservation lookup tables (PI, EMC, Mold), unless
+           PRESERVATIONEVAL_SKIP_TABLE_BUILD=1 is set and they exist already
         2. Runs standard build process
         """
         self.execute(
@@ -7,9 +7,12 @@ This module handles the complete table generation and installation process:
 4. Installs tables as a Python module
 """
 
+import sys
 from importlib import import_module, reload
 from pathlib import Path
 
+import requests
+
 from preservationeval.utils.logging import Environment, setup_logging
 
 from .const import (
@@ -20,11 +23,15 @@ from .const import (
     TABLES_MODULE_NAME,
 )
 from .export import generate_tables_module
-from .parse import fetch_and_validate_tables
+from .parse import extract_and_validate_tables, fetch_and_validate_tables
 from .paths import PathError, find_package_root, get_module_path
 
 logger = setup_logging(__name__, env=Environment.INSTALL)
 
+# Only colour the success message when the console log goes to a terminal
+_GREEN = "\033[92m" if sys.stdout.isatty() else ""
+_RESET = "\033[0m" if sys.stdout.isatty() else ""
+
 
 class TableGenerationError(Exception):
     """Base exception for table generation errors."""
@@ -65,8 +72,20 @@ def verify_tables(module_path: str) -> bool:
         raise TableGenerationError("Table verification failed", e) from e
 
 
-def generate_tables(package_path: Path | None = None) -> None:
-    """Generate and install lookup tables for preservationeval."""
+def generate_tables(
+    package_path: Path | None = None,
+    js_content: str | None = None,
+    session: requests.Session | None = None,
+) -> None:
+    """Generate and install lookup tables for preservationeval.
+
+    Args:
+        package_path: Package directory to write the tables module to
+            (default: located from the package root)
+        js_content: Already downloaded dp.js source. If None, dp.js is
+            downloaded from DP_JS_URL.
+        session: Session to download dp.js with (default: a one-off request)
+    """
     try:
         # Get installation path
         if package_path is None:
@@ -81,8 +100,14 @@ def generate_tables(package_path: Path | None = None) -> None:
                 f"Installation path {package_path} is not a package."
             )
 
-        logger.debug("Fetching and validating tables...")
-        pi_table, emc_table, mold_table = fetch_and_validate_tables(DP_JS_URL)
+        if js_content is None:
+            logger.debug("Fetching and validating tables...")
+            pi_table, emc_table, mold_table = fetch_and_validate_tables(
+                DP_JS_URL, session=session
+            )
+        else:
+            logger.debug("Validating tables...")
+            pi_table, emc_table, mold_table = extract_and_validate_tables(js_content)
 
         logger.debug("Generating tables module...")
         generate_tables_module(
@@ -97,7 +122,7 @@ def generate_tables(package_path: Path | None = None) -> None:
         module_path = f"{MODULE_NAME}.{TABLES_MODULE_NAME}"
         verify_tables(module_path)
 
-        logger.debug("\033[92mTables generated successfully\033[0m")
+        logger.debug("%sTables generated successfully%s", _GREEN, _RESET)
 
     except (PathError, Exception) as e:
         error_msg = f"Table generation failed: {e}"
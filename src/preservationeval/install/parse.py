@@ -490,13 +490,13 @@ def extract_raw_arrays(
         raise ExtractionError(f"Failed to parse array values: {e}") from e
 
 
-def fetch_and_validate_tables(
-    url: str,
+def extract_and_validate_tables(
+    js_content: str,
 ) -> tuple[PITable, EMCTable, MoldTable]:
-    """Fetch and process preservation lookup tables.
+    """Extract and validate preservation lookup tables from dp.js source.
 
     Args:
-        url: URL to fetch the JavaScript file containing table data
+        js_content: JavaScript source containing table data
 
     Returns:
         Tuple containing:
@@ -505,18 +505,11 @@ def fetch_and_validate_tables(
             - MoldTable: Mold risk lookup table
 
     Raises:
-        requests.RequestException: If table download fails
         ExtractionError: If table data cannot be extracted
         ValidationError: If table data is invalid
         TableMetadataError: If table metadata is invalid
     """
     try:
-        # Fetch JavaScript content
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        js_content = response.text
-        logger.debug(f"Downloaded JavaScript source ({len(js_content)} bytes)")
-
         # Extract table information and data
         table_info = extract_table_meta_data(js_content)
         logger.debug("Successfully extracted table metadata")
@@ -565,9 +558,6 @@ def fetch_and_validate_tables(
         logger.debug("Successfully created all lookup tables")
         return pi_table, emc_table, mold_table
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to download JavaScript source: {e}")
-        raise
     except (ExtractionError, ValidationError, TableMetadataError) as e:
         logger.error(f"Failed to process table data: {e}")
         raise
@@ -575,3 +565,39 @@ def fetch_and_validate_tables(
         error_msg = "Unexpected error while processing tables"
         logger.error(f"{error_msg}: {e}")
         raise ExtractionError(error_msg) from e
+
+
+def fetch_and_validate_tables(
+    url: str,
+    session: requests.Session | None = None,
+) -> tuple[PITable, EMCTable, MoldTable]:
+    """Fetch and process preservation lookup tables.
+
+    Args:
+        url: URL to fetch the JavaScript file containing table data
+        session: Session to download with, so callers can reuse its
+            connection pool (default: a one-off request)
+
+    Returns:
+        Tuple containing:
+            - PITable: Preservation Index lookup table
+            - EMCTable: Equilibrium Moisture Content lookup table
+            - MoldTable: Mold risk lookup table
+
+    Raises:
+        requests.RequestException: If table download fails
+        ExtractionError: If table data cannot be extracted
+        ValidationError: If table data is invalid
+        TableMetadataError: If table metadata is invalid
+    """
+    try:
+        # Fetch JavaScript content
+        response = (session or requests).get(url, timeout=10)
+        response.raise_for_status()
+        js_content = response.text
+        logger.debug(f"Downloaded JavaScript source ({len(js_content)} bytes)")
+    except requests.RequestException as e:
+        logger.error(f"Failed to download JavaScript source: {e}")
+        raise
+
+    return extract_and_validate_tables(js_content)
@@ -139,6 +139,117 @@ class LookupTable(Generic[T]):
 
         return cast(T, self.data[temp_idx, rh_idx])
 
+    def lookup_array(
+        self,
+        temps: npt.ArrayLike,
+        rhs: npt.ArrayLike,
+        fill_value: T | None = None,
+    ) -> npt.NDArray[np.floating[Any] | np.integer[Any]]:
+        """Get values for many (temp, rh) pairs at once.
+
+        Vectorized counterpart of __getitem__, applying the same boundary
+        handling and rounding to whole arrays instead of one pair at a time.
+
+        Args:
+            temps: Temperature values.
+            rhs: Relative humidity values, same shape as temps.
+            fill_value: Value returned for out-of-bounds pairs that cannot be
+                clamped. If None, an exception is raised instead.
+
+        Returns:
+            Array of table values with the same shape as temps.
+
+        Raises:
+            ValueError: If temps and rhs have different shapes.
+            TemperatureError: If a temp. is out of bounds, cannot be clamped
+                and no fill_value is given.
+            HumidityError: If a humidity is out of bounds, cannot be clamped
+                and no fill_value is given.
+        """
+        temp_arr = np.asarray(temps, dtype=np.float64)
+        rh_arr = np.asarray(rhs, dtype=np.float64)
+        if temp_arr.shape != rh_arr.shape:
+            raise ValueError(
+                f"Shape mismatch, got temps: {temp_arr.shape}, rhs: {rh_arr.shape}"
+            )
+
+        temp_arr, temp_oob = self._handle_array_bounds(
+            temp_arr, self.temp_min, self.temp_max, BoundaryBehavior.CLAMP_X
+        )
+        rh_arr, rh_oob = self._handle_array_bounds(
+            rh_arr, self.rh_min, self.rh_max, BoundaryBehavior.CLAMP_Y
+        )
+        if fill_value is None:
+            if temp_oob.any():
+                temp = temp_arr[temp_oob].flat[0]
+                raise TemperatureError(
+                    f"Temperature {temp} outside {self.temp_min}..{self.temp_max}"
+                )
+            if rh_oob.any():
+                rh = rh_arr[rh_oob].flat[0]
+                raise HumidityError(f"RH {rh} outside {self.rh_min}..{self.rh_max}")
+
+        # Point out-of-bounds pairs at a valid cell, they are filled in below
+        invalid = temp_oob | rh_oob
+        temp_arr[invalid] = self.temp_min
+        rh_arr[invalid] = self.rh_min
+
+        # Calculate indices
+        temp_idx = self._round_array(temp_arr) - self.temp_min
+        rh_idx = self._round_array(rh_arr) - self.rh_min
+
+        values = cast(
+            npt.NDArray[np.floating[Any] | np.integer[Any]],
+            self.data[temp_idx, rh_idx],
+        )
+        if invalid.any():
+            values[invalid] = fill_value
+        return values
+
+    def _handle_array_bounds(
+        self,
+        values: npt.NDArray[np.float64],
+        min_value: int,
+        max_value: int,
+        clamp_flag: BoundaryBehavior,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """Handle boundary conditions for an array of temperature or RH values.
+
+        Args:
+            values: Temperature or humidity values.
+            min_value: Minimum value of the axis.
+            max_value: Maximum value of the axis.
+            clamp_flag: Flag that enables clamping along the axis.
+
+        Returns:
+            Tuple of values after boundary handling and a mask of the values
+            that are still out of bounds.
+        """
+        out_of_bounds = (values < min_value) | (values > max_value)
+        if clamp_flag in self.boundary_behavior:
+            if BoundaryBehavior.LOG in self.boundary_behavior and out_of_bounds.any():
+                self._logger.warning(
+                    f"Clamping {np.count_nonzero(out_of_bounds)} values "
+                    f"to {min_value}..{max_value}"
+                )
+            return np.clip(values, min_value, max_value), np.zeros_like(out_of_bounds)
+        return values.copy(), out_of_bounds
+
+    def _round_array(self, values: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """Round an array of float indices to integers using rounding_func.
+
+        Args:
+            values: Float indices.
+
+        Returns:
+            Integer indices.
+        """
+        if self.rounding_func is self._round_half_up:
+            rounded = np.floor(values + 0.5)
+        else:
+            rounded = np.vectorize(self.rounding_func, otypes=[np.intp])(values)
+        return cast(npt.NDArray[np.intp], rounded.astype(np.intp))
+
     def _validate_index_types(self, indices: TableIndex) -> tuple[float, float]:
         """Validate that indices are of correct type.
 
@@ -1,8 +1,7 @@
 """Configuration settings for preservation calculation validation.
 
 This module contains all configuration parameters used in the validation
-process, including test ranges, JavaScript environment settings, and comparison
-tolerances.
+process, including test ranges and comparison tolerances.
 
 The configuration parameters are defined using dataclasses, which provide
 frozen instances that can be used for type checking and immutability.
@@ -10,15 +9,6 @@ frozen instances that can be used for type checking and immutability.
 
 from dataclasses import dataclass, field
 
-# JavaScript environment configuration
-JS_CONFIG = {
-    "package_json": {
-        "name": "dp-test",
-        "version": "1.0.0",
-        "dependencies": {"puppeteer": "^19.0.0"},
-    },
-}
-
 
 @dataclass(frozen=True)
 class TestConfig:
@@ -1,9 +1,10 @@
 """Test module for preservationeval.install.parse."""
 
-from typing import Final
+from typing import Any, Final
 
 import numpy as np
 import pytest
+import requests
 import requests_mock
 
 from preservationeval.install.parse import (
@@ -11,6 +12,7 @@ from preservationeval.install.parse import (
     TableMetadataError,
     TableType,
     ValidationError,
+    extract_and_validate_tables,
     extract_array_sizes,
     extract_raw_arrays,
     extract_table_meta_data,
@@ -156,6 +158,30 @@ class TestTableExtraction:
         assert isinstance(mold_table.data, np.ndarray)
         assert mold_table.data.dtype in (np.int16, np.int32, np.int64)
 
+    def test_fetch_with_session(self, mock_url_response: None) -> None:
+        """Test that tables can be fetched through a shared session."""
+        with requests.Session() as session:
+            pi_table, _, _ = fetch_and_validate_tables(
+                "http://www.dpcalc.org/dp.js", session=session
+            )
+
+        assert isinstance(pi_table, LookupTable)
+
+    def test_extract_from_content(
+        self, mock_url_response: None, valid_js_content: str
+    ) -> None:
+        """Test that downloaded and given dp.js content give the same tables."""
+        fetched = fetch_and_validate_tables("http://www.dpcalc.org/dp.js")
+        extracted = extract_and_validate_tables(valid_js_content)
+
+        pairs: list[tuple[LookupTable[Any], LookupTable[Any]]] = list(
+            zip(fetched, extracted, strict=True)
+        )
+        for fetched_table, extracted_table in pairs:
+            assert np.array_equal(fetched_table.data, extracted_table.data)
+            assert fetched_table.temp_min == extracted_table.temp_min
+            assert fetched_table.rh_min == extracted_table.rh_min
+
 
 # Validation tests
 @pytest.mark.validation
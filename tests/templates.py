@@ -1,62 +1,86 @@
-"""HTML and JavaScript templates for the test environment.
+"""JavaScript templates for the test environment.
 
-This module contains the templates needed to create the browser-based
-test environment for running the original JavaScript implementation.
-"""
-
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    <script src="dp.js"></script>
-    <script>
-        function runTests(inputs) {
-            return inputs.map(input => {
-                const t = input[0];
-                const rh = input[1];
-                return {
-                    temp: t,
-                    rh: rh,
-                    pi: pi(t, rh),
-                    emc: emc(t, rh),
-                    mold: mold(t, rh)
-                };
-            });
-        }
-    </script>
-</head>
-<body>
-</body>
-</html>
+This module contains the Node.js script that runs the original JavaScript
+implementation (dp.js) for the validation tests.
 """
 
 NODE_SCRIPT_TEMPLATE = """
-const puppeteer = require('puppeteer');
+const fs = require('fs');
+const vm = require('vm');
 
-async function runTests() {
-    const browser = await puppeteer.launch();
-    const page = await browser.newPage();
+// dp.js is written for a browser page and wires up its user interface
+// through jQuery and the DOM when loaded. This stub accepts any property
+// access, call or construction so that the page setup is a no-op and only
+// the pure calculation functions are used.
+const stub = new Proxy(function () {}, {
+    get: (target, prop) => (prop === Symbol.toPrimitive ? () => '' : stub),
+    apply: () => stub,
+    construct: () => stub,
+});
 
-    await page.goto('file://' + process.argv[2]);
+function loadDPJS(path) {
+    const context = { $: stub, jQuery: stub, document: stub, navigator: stub };
+    context.window = context;
+    vm.createContext(context);
+    vm.runInContext(fs.readFileSync(path, 'utf8'), context, { filename: path });
+    return vm.runInContext('({ pi, emc, mold })', context);
+}
 
-    let data = '';
-    process.stdin.resume();
-    process.stdin.setEncoding('utf8');
+// Test cases arrive as a binary frame: a little-endian uint32 case count
+// followed by (temperature, rh) pairs packed as little-endian float64.
+function decodeTestCases(buffer) {
+    const count = buffer.readUInt32LE(0);
+    const inputs = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const offset = 4 + i * 16;
+        inputs[i] = [buffer.readDoubleLE(offset), buffer.readDoubleLE(offset + 8)];
+    }
+    return inputs;
+}
 
-    process.stdin.on('data', (chunk) => {
-        data += chunk;
-    });
+// Number of bytes needed for the frame at the start of the buffer, or
+// null while the case count itself has not arrived yet.
+function frameSize(buffer) {
+    if (buffer.length < 4) {
+        return null;
+    }
+    return 4 + buffer.readUInt32LE(0) * 16;
+}
+
+// Emit the results of a frame as one JSON line of columns, in input order:
+// {"pi": [...], "emc": [...], "mold": [...]}
+function runTests(dp, inputs) {
+    const columns = { pi: [], emc: [], mold: [] };
+    for (const [t, rh] of inputs) {
+        columns.pi.push(dp.pi(t, rh));
+        columns.emc.push(dp.emc(t, rh));
+        columns.mold.push(dp.mold(t, rh));
+    }
+    return JSON.stringify(columns) + '\\n';
+}
+
+function main() {
+    const dp = loadDPJS(process.argv[2]);
 
-    process.stdin.on('end', async () => {
-        const inputs = JSON.parse(data);
-        const results = await page.evaluate((testInputs) => {
-            return runTests(testInputs);
-        }, inputs);
-        console.log(JSON.stringify(results));
-        await browser.close();
+    // Frames are answered strictly in order, one line of results per frame,
+    // so the process stays up for as many batches as the caller sends.
+    let pending = Buffer.alloc(0);
+    process.stdin.on('data', (chunk) => {
+        pending = Buffer.concat([pending, chunk]);
+        let size = frameSize(pending);
+        while (size !== null && pending.length >= size) {
+            const inputs = decodeTestCases(pending.subarray(0, size));
+            pending = pending.subarray(size);
+            process.stdout.write(runTests(dp, inputs));
+            size = frameSize(pending);
+        }
     });
 }
 
-runTests().catch(console.error);
+try {
+    main();
+} catch (error) {
+    console.error(error);
+    process.exit(1);
+}
 """
@@ -1,8 +1,14 @@
 """Validation tests comparing Python implementation against JavaScript reference.
 
-This module provides two types of validation tests:
+This module provides the following validation tests:
 1. test_against_javascript: Runs random test cases through both implementations
 2. test_specific_cases: Tests specific cases from saved test data
+3. test_compare_results: Tests the comparison of implementation results
+4. test_dpjs_conditional_download: Tests re-download of unchanged dp.js
+5. test_generate_test_cases: Tests random and full-grid test case generation
+6. test_js_runner: Runs the Node.js test script against a stub dp.js
+7. test_javascript_results_cache: Tests caching of JavaScript results
+8. test_decode_results_nan: Tests decoding of NaN results from JavaScript
 
 To run these tests:
     pytest test_validation.py               # Run all validation tests
@@ -11,19 +17,34 @@ To run these tests:
     pytest test_validation.py -k specific   # Run only specific cases
 
 Requirements:
-    - Node.js and npm must be installed
+    - Node.js must be installed
     - Test data directory must exist with:
         - dp.js: JavaScript reference implementation
-        - test_data.json: Saved test cases and results
+        - test_data.npz: Saved test cases and results
 """
 
-import json
+import shutil
 from pathlib import Path
-from typing import Any
+
+import numpy as np
+import pytest
+import requests_mock
 
 from preservationeval import emc, mold, pi
+from preservationeval.const import DP_JS_URL
+from tests import validate_core
 from tests.config import ComparisonConfig
-from tests.validate_core import ValidationTest
+from tests.templates import NODE_SCRIPT_TEMPLATE
+from tests.validate_core import (
+    RESULT_DTYPE,
+    DPJSInfo,
+    JSRunner,
+    Results,
+    TestCases,
+    ValidationDifference,
+    ValidationTest,
+    decode_results,
+)
 
 
 def test_against_javascript(validation: ValidationTest) -> None:
@@ -45,14 +66,12 @@ def test_specific_cases(test_data_dir: Path) -> None:
     Args:
         test_data_dir: Path fixture providing test data directory
     """
-    test_data_path = test_data_dir / "test_data.json"
+    test_data_path = test_data_dir / "test_data.npz"
     assert test_data_path.exists(), f"Test data file not found at {test_data_path}"
 
-    with Path.open(test_data_path) as f:
-        data: dict[str, Any] = json.load(f)
-
-    cases: list[list[float]] = data["cases"]
-    results: list[dict[str, float]] = data["results"]
+    with np.load(test_data_path) as data:
+        cases: list[list[float]] = data["cases"].tolist()
+        results = data["results"]
 
     for case, expected in zip(cases, results, strict=False):
         t, rh = case
@@ -61,3 +80,143 @@ def test_specific_cases(test_data_dir: Path) -> None:
             abs(emc(t, rh) - expected["emc"]) < ComparisonConfig.emc_tolerance
         ), f"EMC mismatch at T={t}, RH={rh}"
         assert mold(t, rh) == expected["mold"], f"Mold mismatch at T={t}, RH={rh}"
+
+
+def test_compare_results() -> None:
+    """Test that only mismatching results are reported as differences."""
+    js_results = np.array(
+        [
+            (20.0, 50.0, 45, 9.4, 0),
+            (25.0, 80.0, 12, 16.0, 20),
+            (-5.0, 30.0, 999, 6.5, 0),
+        ],
+        dtype=RESULT_DTYPE,
+    )
+    py_results = np.array(
+        [
+            (20.0, 50.0, 45, 9.4, 0),
+            (25.0, 80.0, 13, 16.0, 21),
+            (-5.0, 30.0, 999, 6.6, 0),
+        ],
+        dtype=RESULT_DTYPE,
+    )
+
+    differences = ValidationTest()._compare_results(js_results, py_results)
+
+    assert differences["pi"] == [ValidationDifference(25.0, 80.0, 12, 13)]
+    assert differences["emc"] == [ValidationDifference(-5.0, 30.0, 6.5, 6.6)]
+    assert differences["mold"] == [ValidationDifference(25.0, 80.0, 20, 21)]
+    assert not any(ValidationTest()._compare_results(js_results, js_results).values())
+
+
+def test_dpjs_conditional_download(
+    requests_mock: requests_mock.Mocker, tmp_path: Path
+) -> None:
+    """Test that an unchanged dp.js is not downloaded again."""
+    requests_mock.get(DP_JS_URL, text="var pi;", headers={"ETag": '"v1"'})
+    dp_js_path = tmp_path / "dp.js"
+    DPJSInfo.from_url(DP_JS_URL).save(dp_js_path)
+
+    cached = DPJSInfo.from_file(dp_js_path)
+    assert cached.etag == '"v1"'
+
+    requests_mock.get(DP_JS_URL, status_code=304)
+    assert DPJSInfo.from_url(DP_JS_URL, cached=cached) is cached
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+
+def test_generate_test_cases(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that test cases lie on the grid and cover it when large enough."""
+    monkeypatch.setattr(validate_core, "CACHE_DIR", tmp_path)
+    validation = ValidationTest(temp_range=(0, 2, 0.5), rh_range=(10, 20, 5))
+
+    cases = validation._generate_test_cases(3)
+    assert cases.shape == (7, 2)
+    assert np.all(np.isin(cases[:, 0], [0, 0.5, 1, 1.5, 2]))
+    assert np.all(np.isin(cases[:, 1], [10, 15, 20]))
+    assert {(0, 10), (0, 20), (2, 10), (2, 20)} <= set(map(tuple, cases.tolist()))
+
+    grid = validation._generate_test_cases(100)
+    assert grid.shape == (15, 2)
+    assert np.array_equal(np.unique(grid, axis=0), grid)
+
+    # The grid is cached and loaded from disk on the next run
+    assert len(list(tmp_path.glob("grid_*.npy"))) == 1
+    assert np.array_equal(validation._generate_test_cases(100), grid)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+def test_js_runner(tmp_path: Path) -> None:
+    """Test that the Node.js test script runs dp.js for every batch."""
+    (tmp_path / "run_tests.js").write_text(NODE_SCRIPT_TEMPLATE)
+    # dp.js touches jQuery when loaded, which the test script stubs out
+    dp_js_path = tmp_path / "dp.js"
+    dp_js_path.write_text(
+        "$(document).ready(function () { $('#temp').val(''); });\n"
+        "var pi = function (t, rh) { return Math.round(t) + Math.round(rh); };\n"
+        "var emc = function (t, rh) { return rh / 10; };\n"
+        "var mold = function (t, rh) { return rh < 65 ? 0 : Math.round(t); };\n"
+    )
+    cases = np.array([[20.0, 50.0], [25.0, 80.0], [-5.5, 30.0]] * 5)
+
+    node_path = shutil.which("node")
+    assert node_path is not None
+    with JSRunner(node_path, tmp_path, dp_js_path, batch_size=4) as runner:
+        results = runner.run(cases)
+        # The process stays up for further runs
+        assert np.array_equal(runner.run(cases[:1]), results[:1])
+
+    assert np.array_equal(results["temp"], cases[:, 0])
+    assert np.array_equal(results["rh"], cases[:, 1])
+    assert np.array_equal(results["pi"], [70, 105, 25] * 5)
+    assert np.allclose(results["emc"], [5.0, 8.0, 3.0] * 5)
+    assert np.array_equal(results["mold"], [0, 25, 0] * 5)
+
+
+def test_javascript_results_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that only cached case sets are stored, for the current dp.js only."""
+    monkeypatch.setattr(validate_core, "CACHE_DIR", tmp_path)
+    calls: list[int] = []
+
+    def run_javascript_tests(cases: TestCases) -> Results:
+        calls.append(len(cases))
+        return np.zeros(len(cases), dtype=RESULT_DTYPE)
+
+    validation = ValidationTest()
+    validation._dpjs_hash = "old"
+    monkeypatch.setattr(validation, "_check_node_installation", lambda: None)
+    monkeypatch.setattr(validation, "_run_javascript_tests", run_javascript_tests)
+    cases = np.array([[20.0, 50.0], [25.0, 80.0]])
+
+    validation._get_javascript_results(cases)
+    assert not list(tmp_path.iterdir())
+
+    validation._get_javascript_results(cases, use_cache=True)
+    validation._get_javascript_results(cases, use_cache=True)
+    assert calls == [2, 2]
+    assert [p.name[:7] for p in tmp_path.iterdir()] == ["js_old_"]
+
+    # Writing results for a new dp.js removes the stale entry
+    validation._dpjs_hash = "new"
+    validation._get_javascript_results(cases, use_cache=True)
+    assert [p.name[:7] for p in tmp_path.iterdir()] == ["js_new_"]
+
+
+def test_decode_results_nan() -> None:
+    """Test that NaN results are kept for EMC and reported for integer columns."""
+    cases = np.array([[20.0, 50.0], [25.0, 80.0], [-5.0, 30.0]])
+    lines = [
+        b'{"pi": [45], "emc": [9.4], "mold": [0]}\n',
+        b'{"pi": [12, 999], "emc": [null, 6.5], "mold": [20, 0]}\n',
+    ]
+
+    results = decode_results(cases, lines)
+    assert np.isnan(results["emc"][1])
+    assert np.array_equal(results["pi"], [45, 12, 999])
+
+    lines[1] = b'{"pi": [12, 999], "emc": [16.0, 6.5], "mold": [20, null]}\n'
+    with pytest.raises(ValueError, match=r"mold in batch 1 \(T=-5.0, RH=30.0\)"):
+        decode_results(cases, lines)
@@ -233,3 +233,84 @@ class TestRounding:
         """Test faulty input to set_rounding_func."""
         with pytest.raises(TypeError):
             int_table.set_rounding_func("this input is not ok")  # type: ignore
+
+
+@pytest.mark.unit
+class TestLookupArray:
+    """Test vectorized table access."""
+
+    @pytest.fixture
+    def indices(self) -> tuple[NDArray[floating[Any]], NDArray[floating[Any]]]:
+        """Create random (temp, rh) pairs, including out-of-bounds values."""
+        rng = np.random.default_rng(42)
+        temps = rng.uniform(TEMP_MIN - 10, TEMP_MAX + 10, size=500)
+        rhs = rng.uniform(RH_MIN - 10, RH_MAX + 10, size=500)
+        return temps, rhs
+
+    def test_matches_getitem(self, int_table: LookupTable[int]) -> None:
+        """Test that vectorized access matches scalar access."""
+        rng = np.random.default_rng(42)
+        temps = rng.uniform(TEMP_MIN, TEMP_MAX, size=500)
+        rhs = rng.uniform(RH_MIN, RH_MAX, size=500)
+        values = int_table.lookup_array(temps, rhs)
+        expected = [
+            int_table[t, rh] for t, rh in zip(temps.tolist(), rhs.tolist(), strict=True)
+        ]
+        assert values.tolist() == expected
+
+    def test_clamp_behavior(
+        self,
+        clamp_table: LookupTable[int],
+        indices: tuple[NDArray[floating[Any]], NDArray[floating[Any]]],
+    ) -> None:
+        """Test that clamping matches scalar access."""
+        temps, rhs = indices
+        values = clamp_table.lookup_array(temps, rhs)
+        expected = [
+            clamp_table[t, rh]
+            for t, rh in zip(temps.tolist(), rhs.tolist(), strict=True)
+        ]
+        assert values.tolist() == expected
+
+    @pytest.mark.parametrize(
+        "temps,rhs,expected_error",
+        [
+            ([20, TEMP_MAX + 1], [50, 50], TemperatureError),
+            ([20, 20], [50, RH_MIN - 1], HumidityError),
+        ],
+    )
+    def test_raise_behavior(
+        self,
+        int_table: LookupTable[int],
+        temps: list[float],
+        rhs: list[float],
+        expected_error: type[Exception],
+    ) -> None:
+        """Test RAISE boundary behavior."""
+        with pytest.raises(expected_error):
+            int_table.lookup_array(temps, rhs)
+
+    def test_fill_value(
+        self,
+        int_table: LookupTable[int],
+        indices: tuple[NDArray[floating[Any]], NDArray[floating[Any]]],
+    ) -> None:
+        """Test that out-of-bounds pairs get the fill value."""
+        temps, rhs = indices
+        values = int_table.lookup_array(temps, rhs, fill_value=-1)
+        for t, rh, value in zip(temps.tolist(), rhs.tolist(), values, strict=True):
+            try:
+                assert value == int_table[t, rh]
+            except (TemperatureError, HumidityError):
+                assert value == -1
+
+    def test_custom_rounding(self, int_table: LookupTable[int]) -> None:
+        """Test that a custom rounding function is applied."""
+        int_table.set_rounding_func(round)
+        values = int_table.lookup_array([2.5, -1.5], [2.5, 3.5])
+        assert values.tolist() == [int_table[2.5, 2.5], int_table[-1.5, 3.5]]
+
+    def test_shape_mismatch(self, int_table: LookupTable[int]) -> None:
+        """Test that mismatching shapes are rejected."""
+        with pytest.raises(ValueError):
+            int_table.lookup_array([1.0, 2.0], [50.0])
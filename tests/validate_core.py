@@ -9,42 +9,150 @@ the original JavaScript code from dpcalc.org. It handles:
 """
 
 # pylint: disable=missing-docstring
+import functools
 import hashlib
 import json
 import logging
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from http import HTTPStatus
 from pathlib import Path
+from typing import IO, cast
 
 import numpy as np
+import numpy.typing as npt
+import orjson
 import requests
 
-from preservationeval import emc, mold, pi
 from preservationeval.const import DP_JS_URL
 from preservationeval.utils.logging import setup_logging
 from preservationeval.utils.safepath import create_safe_path
 
-from .config import JS_CONFIG, ComparisonConfig, TestConfig
-from .templates import HTML_TEMPLATE, NODE_SCRIPT_TEMPLATE
+from .config import ComparisonConfig, TestConfig
+from .templates import NODE_SCRIPT_TEMPLATE
+
+try:
+    from preservationeval.tables import emc_table, mold_table, pi_table
+except ImportError:
+    ...
 
 # Setup logging
 logger = setup_logging(__name__)
 
 # Type aliases
 Number = int | float
-TestCase = list[float]  # [temperature, relative_humidity]
-JSResult = dict[str, Number]  # {'pi': int, 'emc': float, 'mold': int}
+TestCases = npt.NDArray[np.float64]  # (N, 2) [temperature, relative_humidity]
+Results = npt.NDArray[np.void]  # Structured array with RESULT_DTYPE fields
 
 # Constants
 TEST_DATA_DIR = create_safe_path(
     Path(__file__).parent, "data"
 )  # Go up one level to tests/data
 DP_JS_PATH = create_safe_path(TEST_DATA_DIR, "dp.js")
-TEST_DATA_PATH = create_safe_path(TEST_DATA_DIR, "test_data.json")
+TEST_DATA_PATH = create_safe_path(TEST_DATA_DIR, "test_data.npz")
+NODE_WORK_DIR = create_safe_path(TEST_DATA_DIR, ".node_workdir")
+CACHE_DIR = create_safe_path(TEST_DATA_DIR, "cache")
+RESULT_DTYPE = np.dtype(
+    [
+        ("temp", np.float64),
+        ("rh", np.float64),
+        ("pi", np.int32),
+        ("emc", np.float64),
+        ("mold", np.int32),
+    ]
+)
+
+
+def encode_test_cases(test_cases: TestCases) -> bytes:
+    """Encode test cases as a compact binary frame for the Node.js runner.
+
+    The frame is a little-endian uint32 case count followed by the
+    (temperature, relative_humidity) pairs as little-endian float64 values.
+
+    Args:
+        test_cases: (N, 2) array of [temperature, relative_humidity] pairs
+
+    Returns:
+        Binary frame to write to the Node.js process stdin
+    """
+    pairs = np.ascontiguousarray(test_cases, dtype="<f8")
+    return struct.pack("<I", len(pairs)) + pairs.tobytes()
+
+
+def decode_results(test_cases: TestCases, lines: Iterable[bytes]) -> Results:
+    """Decode output from the Node.js runner.
+
+    Args:
+        test_cases: (N, 2) array of [temperature, relative_humidity] pairs
+        lines: Lines of output from the Node.js process, one JSON object of
+            pi, emc and mold columns per frame, in test case order
+
+    Returns:
+        Results from JavaScript implementation
+
+    dp.js results that are NaN arrive as JSON null. They are kept as NaN
+    in float columns and rejected in integer columns.
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON
+        ValueError: If an integer column holds null, or the output does not
+            cover all test cases
+    """
+    results = np.empty(len(test_cases), dtype=RESULT_DTYPE)
+    results["temp"] = test_cases[:, 0]
+    results["rh"] = test_cases[:, 1]
+
+    start = 0
+    for batch, line in enumerate(lines):
+        columns = orjson.loads(line)
+        stop = start + len(columns["pi"])
+        for name in ("pi", "emc", "mold"):
+            values = columns[name]
+            if None in values:
+                if results.dtype[name].kind != "f":
+                    index = start + values.index(None)
+                    raise ValueError(
+                        f"JavaScript returned NaN for {name} in batch {batch} "
+                        f"(T={results['temp'][index]}, RH={results['rh'][index]})"
+                    )
+                values = [np.nan if value is None else value for value in values]
+            results[name][start:stop] = values
+        start = stop
+
+    if start != len(results):
+        raise ValueError(f"Result count mismatch: expected {len(results)}, got {start}")
+    return results
+
+
+@functools.cache
+def _get_session() -> requests.Session:
+    """Return the HTTP session shared by downloads, reusing its connections."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "preservationeval-validate"})
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def _read_hash_file(hash_path: Path, mtime_ns: int) -> str:
+    """Read the hash from a .hash file, cached on path and modification time.
+
+    Args:
+        hash_path: Path to .hash file
+        mtime_ns: Modification time of the file, part of the cache key only
+
+    Returns:
+        Hash string stored in the file
+    """
+    hash_info = json.loads(hash_path.read_text())
+    return str(hash_info["hash"])
 
 
 @dataclass
@@ -55,39 +163,74 @@ class DPJSInfo:
         content: The JavaScript source code
         hash: SHA-256 hash of the content
         url: Source URL of the JavaScript
+        etag: ETag header of the download, if provided by the server
+        last_modified: Last-Modified header of the download, if provided
     """
 
     content: str
     hash: str
     url: str
+    etag: str | None = None
+    last_modified: str | None = None
 
     @classmethod
     def from_file(cls, path: Path) -> "DPJSInfo":
-        """Create DPJSInfo from local file."""
+        """Create DPJSInfo from local file.
+
+        Download headers are read from the .hash file next to it, if present.
+        """
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
         content = path.read_text()
         hash_value = hashlib.sha256(content.encode()).hexdigest()
-        return cls(content=content, hash=hash_value, url=DP_JS_URL)  # Use the constant
+        hash_path = path.with_suffix(".hash")
+        hash_info = json.loads(hash_path.read_text()) if hash_path.exists() else {}
+        return cls(
+            content=content,
+            hash=hash_value,
+            url=DP_JS_URL,  # Use the constant
+            etag=hash_info.get("etag"),
+            last_modified=hash_info.get("last_modified"),
+        )
 
     @classmethod
-    def from_url(cls, url: str) -> "DPJSInfo":
+    def from_url(cls, url: str, cached: "DPJSInfo | None" = None) -> "DPJSInfo":
         """Download and create DPJSInfo from URL.
 
+        If a cached version is given, the request is made conditional on its
+        ETag / Last-Modified headers, and the cached version is returned if
+        the server reports it as unchanged.
+
         Args:
             url: URL to download dp.js from
+            cached: Previously downloaded version, if any
 
         Returns:
-            DPJSInfo instance with downloaded content
+            DPJSInfo instance with downloaded content, or cached if unchanged
 
         Raises:
             requests.RequestException: If download fails
         """
-        response = requests.get(url, timeout=10)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = _get_session().get(url, headers=headers, timeout=10)
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            return cached
         response.raise_for_status()
         content = response.text
         hash_value = hashlib.sha256(content.encode()).hexdigest()
-        return cls(content=content, hash=hash_value, url=url)
+        return cls(
+            content=content,
+            hash=hash_value,
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
     def save(self, path: Path) -> None:
         """Save dp.js content and hash information.
@@ -100,14 +243,24 @@ class DPJSInfo:
         - hash: SHA-256 hash of the content
         - url: Source URL
         - date: ISO format timestamp of when the file was saved
+        - etag / last_modified: Download headers used for conditional updates
+
+        Both files are replaced atomically.
         """
-        path.write_text(self.content)
         hash_info = {
             "hash": self.hash,
             "url": self.url,
             "date": datetime.now().isoformat(),
+            "etag": self.etag,
+            "last_modified": self.last_modified,
         }
-        path.with_suffix(".hash").write_text(json.dumps(hash_info, indent=2))
+        for file_path, text in (
+            (path, self.content),
+            (path.with_suffix(".hash"), json.dumps(hash_info, indent=2)),
+        ):
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
+            tmp_path.write_text(text)
+            tmp_path.replace(file_path)
 
     @staticmethod
     def load_hash(path: Path) -> str | None:
@@ -121,13 +274,12 @@ class DPJSInfo:
         """
         hash_path = path.with_suffix(".hash")
         if hash_path.exists():
-            hash_info = json.loads(hash_path.read_text())
-            return str(hash_info["hash"])
+            return _read_hash_file(hash_path, hash_path.stat().st_mtime_ns)
         else:
             return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationDifference:
     """Represents a difference between JavaScript and Python implementations.
 
@@ -144,6 +296,132 @@ class ValidationDifference:
     py_value: Number
 
 
+class JSRunner:
+    """Long-lived Node.js process running test cases through dp.js.
+
+    Test cases are sent as binary frames (see encode_test_cases) and the
+    runner answers each frame with one line of result columns. dp.js is
+    loaded once and the process exits when the runner is closed, so any
+    number of batches can be run without paying the startup cost again.
+
+    Each run is split into frames of about batch_size cases, which are
+    written from a background thread while results are read, so Python
+    reads results of one frame while Node.js evaluates the next.
+
+    Example:
+        with JSRunner(node_path, work_dir, dpjs_path) as runner:
+            results = runner.run(test_cases)
+    """
+
+    def __init__(
+        self, node_path: str, work_dir: Path, dpjs_path: Path, batch_size: int = 256
+    ) -> None:
+        """Initialize runner.
+
+        Args:
+            node_path: Path to node executable
+            work_dir: Directory with run_tests.js
+            dpjs_path: Path to the dp.js file to load
+            batch_size: Approximate number of test cases per frame
+        """
+        self.node_path = node_path
+        self.work_dir = work_dir
+        self.dpjs_path = dpjs_path
+        self.batch_size = batch_size
+        self._process: subprocess.Popen[bytes] | None = None
+        # One thread drains stderr, the other writes test case frames
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._stderr: Future[bytes] | None = None
+
+    def __enter__(self) -> "JSRunner":
+        """Start the Node.js process."""
+        self._process = subprocess.Popen(  # noqa: S603
+            [
+                self.node_path,
+                str(create_safe_path(self.work_dir, "run_tests.js")),
+                str(self.dpjs_path),
+            ],
+            cwd=self.work_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=-1,
+        )
+        if self._process.stderr is not None:
+            # Drain stderr in the background so it can never block Node.js
+            self._stderr = self._pool.submit(self._process.stderr.read)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the Node.js process and report a failed exit."""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                logger.debug("JavaScript process closed its input early")
+        returncode = process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+        stderr = self._read_stderr()
+        self._pool.shutdown()
+        if returncode != 0 and exc_info[0] is None:
+            raise RuntimeError(f"JavaScript execution failed: {stderr}")
+
+    def run(self, test_cases: TestCases) -> Results:
+        """Run test cases through the JavaScript implementation.
+
+        Args:
+            test_cases: (N, 2) array of [temperature, relative_humidity] pairs
+
+        Returns:
+            Results from JavaScript implementation
+
+        Raises:
+            RuntimeError: If the runner is not started or JavaScript fails
+        """
+        process = self._process
+        if process is None or process.stdin is None or process.stdout is None:
+            raise RuntimeError("JavaScript runner not started")
+
+        batches = np.array_split(test_cases, max(1, len(test_cases) // self.batch_size))
+        writer = self._pool.submit(self._write_batches, process.stdin, batches)
+
+        lines = [process.stdout.readline() for _ in batches]
+        if lines and not lines[-1]:
+            process.wait()
+            raise RuntimeError(f"JavaScript execution failed: {self._read_stderr()}")
+
+        try:
+            writer.result()
+        except BrokenPipeError as e:
+            raise RuntimeError(
+                f"JavaScript execution failed: {self._read_stderr()}"
+            ) from e
+
+        try:
+            return decode_results(test_cases, lines)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Failed to parse JavaScript output: %s", e)
+            raise RuntimeError(f"Invalid output from JavaScript: {e}") from e
+
+    @staticmethod
+    def _write_batches(stdin: IO[bytes], batches: list[TestCases]) -> None:
+        """Write test case batches to the Node.js process, one frame each."""
+        for batch in batches:
+            stdin.write(encode_test_cases(batch))
+            stdin.flush()
+
+    def _read_stderr(self) -> str:
+        """Return stderr of the Node.js process once it has exited."""
+        if self._stderr is None:
+            return ""
+        return self._stderr.result().decode(errors="replace")
+
+
 @dataclass
 class ValidationTest:
     """Handles validation of JavaScript vs Python implementation.
@@ -171,33 +449,77 @@ class ValidationTest:
         self.force_update = force_update
         self.temp_range = temp_range
         self.rh_range = rh_range
-        self.temp_dir: Path | None = None
+        self._rng = np.random.default_rng()
+
+        # Grid used for random test cases, as (min, step) and number of steps
+        t_min, t_max, t_step = temp_range
+        rh_min, rh_max, rh_step = rh_range
+        self._grid_min = np.array([t_min, rh_min], dtype=np.float64)
+        self._grid_step = np.array([t_step, rh_step], dtype=np.float64)
+        self._grid_steps = np.array(
+            [int((t_max - t_min) / t_step), int((rh_max - rh_min) / rh_step)]
+        )
+        self.work_dir: Path | None = None
+        self._dpjs_hash: str | None = None
 
     def setup(self) -> None:
         """Set up test environment.
 
-        Creates necessary directories and ensures dp.js is available.
+        Creates necessary directories, ensures dp.js is available and
+        prepares the Node.js work directory. Calling setup repeatedly reuses
+        the work directory as long as dp.js and the test templates are
+        unchanged.
 
         Raises:
             RuntimeError: If environment setup fails
         """
         TEST_DATA_DIR.mkdir(exist_ok=True)
         self._ensure_dpjs()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.work_dir = self._prepare_work_dir()
 
     def cleanup(self) -> None:
-        """Clean up temporary test environment."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
+        """Clean up test environment.
+
+        The work directory is kept for reuse by later runs. It is keyed on
+        the test script, so a changed script gets a new directory and the old
+        one is removed by _prepare_work_dir.
+        """
+        self.work_dir = None
+
+    def _prepare_work_dir(self) -> Path:
+        """Prepare the Node.js work directory with the test script.
+
+        dp.js is passed to the script by path, so the directory is keyed on
+        the test script only and written when the script has changed. Work
+        directories for earlier versions are removed.
+
+        Returns:
+            Path to work directory
+        """
+        key = hashlib.sha256(NODE_SCRIPT_TEMPLATE.encode()).hexdigest()[:16]
+        work_dir = create_safe_path(NODE_WORK_DIR, key)
+        if work_dir.is_dir():
+            logger.debug("Reusing work directory %s", work_dir)
+            return work_dir
+
+        # Work directories only hold the test script, so removing the stale
+        # ones is cheap
+        NODE_WORK_DIR.mkdir(exist_ok=True)
+        for stale_dir in NODE_WORK_DIR.iterdir():
+            shutil.rmtree(stale_dir, ignore_errors=True)
+
+        # Populate a staging directory first so a failed setup is never reused
+        staging_dir = Path(tempfile.mkdtemp(dir=NODE_WORK_DIR))
+        create_safe_path(staging_dir, "run_tests.js").write_text(NODE_SCRIPT_TEMPLATE)
+        staging_dir.replace(work_dir)
+        return work_dir
 
     def _ensure_dpjs(self) -> None:
         """Ensure dp.js is available and up to date.
 
         Downloads new version if:
-        - force_update is True
+        - force_update is True and the online version has changed
         - File doesn't exist
-        - Online version has changed (different hash)
 
         Raises:
             RuntimeError: If dp.js cannot be obtained
@@ -207,67 +529,107 @@ class ValidationTest:
         if update_needed:
             try:
                 logger.info("Downloading dp.js...")
-                dpjs = DPJSInfo.from_url(DP_JS_URL)
-                dpjs.save(DP_JS_PATH)
-                logger.info("Downloaded and saved dp.js")
+                cached = DPJSInfo.from_file(DP_JS_PATH) if DP_JS_PATH.exists() else None
+                dpjs = DPJSInfo.from_url(DP_JS_URL, cached=cached)
+                if dpjs is cached:
+                    logger.info("dp.js is unchanged")
+                else:
+                    dpjs.save(DP_JS_PATH)
+                    logger.info("Downloaded and saved dp.js")
             except requests.RequestException as e:
                 logger.error("Failed to download dp.js: %s", e)
                 if not DP_JS_PATH.exists():
                     raise RuntimeError("No dp.js available") from e
 
-    def _generate_test_cases(self, num_cases: int) -> list[TestCase]:
-        """Generate random test cases within configured ranges.
+        self._dpjs_hash = DPJSInfo.load_hash(DP_JS_PATH)
+
+    def _generate_test_cases(self, num_cases: int) -> TestCases:
+        """Generate test cases within configured ranges.
+
+        Cases are drawn at random from the temperature/RH grid, together with
+        the four grid corners. If num_cases covers the whole grid, every grid
+        point is tested exactly once instead.
 
         Args:
-            num_cases: Number of test cases to generate
+            num_cases: Number of random test cases to generate
 
         Returns:
-            List of [temperature, relative_humidity] pairs
+            (N, 2) array of [temperature, relative_humidity] pairs
         """
-        rng = np.random.default_rng()
-
-        # Generate temperature values
-        t_min, t_max, t_step = self.temp_range
-        t_steps = int((t_max - t_min) / t_step)
-        t_indices = rng.integers(0, t_steps + 1, size=num_cases)
-        temps = t_min + (t_indices * t_step)
-
-        # Generate RH values
-        rh_min, rh_max, rh_step = self.rh_range
-        rh_steps = int((rh_max - rh_min) / rh_step)
-        rh_indices = rng.integers(0, rh_steps + 1, size=num_cases)
-        rhs = rh_min + (rh_indices * rh_step)
-
-        return [[float(t), float(rh)] for t, rh in zip(temps, rhs, strict=False)]
-
-    def _save_test_data(self, cases: list[list[float]], results: list[dict]) -> None:  # type: ignore
-        """Save test data for future use."""
-        data = {
-            "generated": datetime.now().isoformat(),
-            "dpjs_hash": DPJSInfo.load_hash(DP_JS_PATH),
-            "cases": cases,
-            "results": results,
-        }
-        path = create_safe_path(TEST_DATA_DIR, "test_data.json")
-        path.write_text(json.dumps(data, indent=2))
+        if self._covers_grid(num_cases):
+            return self._generate_grid_test_cases()
+
+        indices = self._rng.integers(0, self._grid_steps + 1, size=(num_cases, 2))
+        corners = np.array([[0, 0], [0, 1], [1, 0], [1, 1]]) * self._grid_steps
+        return cast(
+            TestCases,
+            self._grid_min + np.vstack([indices, corners]) * self._grid_step,
+        )
 
-    def load_test_data(self) -> tuple[list[list[float]], list[dict]]:  # type: ignore
+    def _covers_grid(self, num_cases: int) -> bool:
+        """Check whether num_cases test cases cover the whole grid."""
+        return bool(num_cases >= np.prod(self._grid_steps + 1))
+
+    def _generate_grid_test_cases(self) -> TestCases:
+        """Generate one test case for every point of the temperature/RH grid.
+
+        The grid only depends on the configured ranges, so it is cached on
+        disk and memory-mapped on later runs.
+
+        Returns:
+            (N, 2) array of [temperature, relative_humidity] pairs
+        """
+        grid_key = np.concatenate([self._grid_min, self._grid_step, self._grid_steps])
+        key = hashlib.sha256(grid_key.tobytes()).hexdigest()[:16]
+        cache_path = create_safe_path(CACHE_DIR, f"grid_{key}.npy")
+        if cache_path.exists():
+            return cast(TestCases, np.load(cache_path, mmap_mode="r"))
+
+        temps, rhs = (
+            self._grid_min[i] + np.arange(self._grid_steps[i] + 1) * self._grid_step[i]
+            for i in range(2)
+        )
+        temp_grid, rh_grid = np.meshgrid(temps, rhs, indexing="ij")
+        cases = np.stack([temp_grid.ravel(), rh_grid.ravel()], axis=1)
+
+        # Write to a temporary file first so a partial grid is never loaded
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp.npy")
+        np.save(tmp_path, cases)
+        tmp_path.replace(cache_path)
+        return cast(TestCases, cases)
+
+    def _save_test_data(self, cases: TestCases, results: Results) -> None:
+        """Save test data for future use.
+
+        Cases and results are stored as binary arrays in a compressed NPZ
+        file, together with the dp.js hash and generation date.
+        """
+        np.savez_compressed(
+            TEST_DATA_PATH,
+            generated=np.array(datetime.now().isoformat()),
+            dpjs_hash=np.array(self._dpjs_hash or ""),
+            cases=cases,
+            results=results,
+        )
+
+    def load_test_data(self) -> tuple[TestCases, Results]:
         """Load saved test cases and verify dp.js hash."""
-        test_data_path = create_safe_path(TEST_DATA_DIR, "test_data.json")
-        if not test_data_path.exists():
+        if not TEST_DATA_PATH.exists():
             raise FileNotFoundError("Test data file not found")
 
-        with Path.open(test_data_path) as f:
-            test_data = json.load(f)
+        with np.load(TEST_DATA_PATH) as test_data:
+            dpjs_hash = str(test_data["dpjs_hash"])
+            cases = test_data["cases"]
+            results = test_data["results"]
 
         # Verify dp.js hash matches
-        current_hash = DPJSInfo.load_hash(DP_JS_PATH)
-        if current_hash != test_data["dpjs_hash"]:
+        if self._dpjs_hash != dpjs_hash:
             logger.warning("Test data was generated with different dp.js version")
             if not self.force_update:
                 logger.warning("Use force_update=True to regenerate test data")
 
-        return test_data["cases"], test_data["results"]
+        return cases, results
 
     def run_tests(
         self, num_cases: int = TestConfig.num_tests, use_cached: bool = True
@@ -275,7 +637,8 @@ class ValidationTest:
         """Run complete validation test suite.
 
         Args:
-            num_cases: Number of random test cases to generate
+            num_cases: Number of random test cases to generate, see
+                _generate_test_cases
             use_cached: Whether to try using cached test data
 
         Returns:
@@ -286,36 +649,33 @@ class ValidationTest:
             RuntimeError: If validation process fails
         """
         try:
-            # Check Node.js installation
-            self._check_node_installation()
-
             # Set up test environment
             self.setup()
 
             # Try to use cached data
+            cached = None
             if use_cached and not self.force_update:
                 try:
-                    test_cases, js_results = self.load_test_data()
+                    cached = self.load_test_data()
                     logger.info("Using cached test data")
-                except (FileNotFoundError, json.JSONDecodeError) as e:
+                except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
                     logger.warning("Could not use cached data: %s", e)
-                    logger.info("Generating new test cases")
-                    test_cases = self._generate_test_cases(num_cases)
-                    logger.info("Running JavaScript tests...")
-                    js_results = self._run_javascript_tests(test_cases)
-                    # Save new test data
-                    self._save_test_data(test_cases, js_results)
+
+            if cached is not None:
+                test_cases, js_results = cached
+                logger.info("Running Python tests...")
+                py_results = self._run_python_tests(test_cases)
             else:
                 logger.info("Generating new test cases")
                 test_cases = self._generate_test_cases(num_cases)
-                logger.info("Running JavaScript tests...")
-                js_results = self._run_javascript_tests(test_cases)
+                # Only the full grid is the same from run to run, random
+                # test cases would never be looked up again
+                js_results, py_results = self._run_implementations(
+                    test_cases, cache_js=self._covers_grid(num_cases)
+                )
                 # Save test data
                 self._save_test_data(test_cases, js_results)
 
-            logger.info("Running Python tests...")
-            py_results = self._run_python_tests(test_cases)
-
             # Compare results
             differences = self._compare_results(js_results, py_results)
 
@@ -337,103 +697,125 @@ class ValidationTest:
         finally:
             self.cleanup()
 
-    def _run_javascript_tests(self, test_cases: list[TestCase]) -> list[JSResult]:
-        """Run test cases through JavaScript implementation.
+    def _run_implementations(
+        self, test_cases: TestCases, cache_js: bool = False
+    ) -> tuple[Results, Results]:
+        """Run test cases through both implementations concurrently.
+
+        The JavaScript side mostly waits on Node.js, so the Python side runs
+        in the meantime instead of after it.
 
         Args:
-            test_cases: List of [temperature, relative_humidity] pairs
+            test_cases: (N, 2) array of [temperature, relative_humidity] pairs
+            cache_js: Whether to cache the JavaScript results, see
+                _get_javascript_results
 
         Returns:
-            List of results from JavaScript implementation
+            Tuple of (JavaScript results, Python results)
 
         Raises:
             RuntimeError: If JavaScript execution fails
         """
-        if self.temp_dir is None:
-            raise RuntimeError("Test environment not set up")
-
-        # Create package.json
-        package_json_path = create_safe_path(self.temp_dir, "package.json")
-        with package_json_path.open("w") as f:
-            json.dump(JS_CONFIG["package_json"], f, indent=2)
-
-        # Create test files
-        test_html_path = create_safe_path(self.temp_dir, "test.html")
-        test_html_path.write_text(HTML_TEMPLATE)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            js_future = executor.submit(
+                self._get_javascript_results, test_cases, cache_js
+            )
+            logger.info("Running Python tests...")
+            py_future = executor.submit(self._run_python_tests, test_cases)
+            return js_future.result(), py_future.result()
 
-        test_js_path = create_safe_path(self.temp_dir, "run_tests.js")
-        test_js_path.write_text(NODE_SCRIPT_TEMPLATE)
+    def _get_javascript_results(
+        self, test_cases: TestCases, use_cache: bool = False
+    ) -> Results:
+        """Get JavaScript results for test cases, from cache if possible.
 
-        # Copy dp.js to temp directory
-        dp_js_dest = create_safe_path(self.temp_dir, "dp.js")
-        shutil.copy(DP_JS_PATH, dp_js_dest)
+        Results are cached on the dp.js hash and a hash of the test cases, so
+        Node.js only runs for combinations that have not been seen before.
+        Only deterministic test case sets such as the full grid should be
+        cached. Writing the cache removes results for other dp.js versions.
 
-        npm_path = shutil.which("npm")
-        if npm_path is None:
-            raise RuntimeError("npm executable not found")
+        Args:
+            test_cases: (N, 2) array of [temperature, relative_humidity] pairs
+            use_cache: Whether to read and write the results cache
 
-        node_path = shutil.which("node")
-        if node_path is None:
-            raise RuntimeError("node executable not found")
+        Returns:
+            Results from JavaScript implementation
 
-        # Run npm install
-        try:
-            # Install dependencies
-            subprocess.run(  # noqa: S603
-                [npm_path, "install"],
-                cwd=self.temp_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+        Raises:
+            RuntimeError: If JavaScript execution fails
+        """
+        use_cache = use_cache and bool(self._dpjs_hash)
+        cache_prefix = f"js_{self._dpjs_hash}_"
+        cases = np.ascontiguousarray(test_cases, dtype=np.float64)
+        case_hash = hashlib.blake2b(cases.tobytes(), digest_size=16).hexdigest()
+        cache_path = create_safe_path(CACHE_DIR, f"{cache_prefix}{case_hash}.npy")
+
+        if use_cache and not self.force_update and cache_path.exists():
+            logger.info("Using cached JavaScript results")
+            return cast(Results, np.load(cache_path))
+
+        self._check_node_installation()
+        logger.info("Running JavaScript tests...")
+        results = self._run_javascript_tests(test_cases)
+
+        if use_cache:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for stale_path in CACHE_DIR.glob("js_*.npy"):
+                if not stale_path.name.startswith(cache_prefix):
+                    stale_path.unlink(missing_ok=True)
+            # Write to a temporary file first so partial results are never loaded
+            tmp_path = cache_path.with_suffix(".tmp.npy")
+            np.save(tmp_path, results)
+            tmp_path.replace(cache_path)
+        return results
+
+    def _run_javascript_tests(self, test_cases: TestCases) -> Results:
+        """Run test cases through JavaScript implementation.
 
-            # Run tests
-            process = subprocess.Popen(  # noqa: S603
-                [node_path, str(test_js_path), str(test_html_path)],
-                cwd=self.temp_dir,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
+        Args:
+            test_cases: (N, 2) array of [temperature, relative_humidity] pairs
 
-            # Send test cases to Node.js process
-            stdout, stderr = process.communicate(input=json.dumps(test_cases))
+        Returns:
+            Results from JavaScript implementation
 
-            if process.returncode != 0:
-                raise RuntimeError(f"JavaScript execution failed: {stderr}")
+        Raises:
+            RuntimeError: If JavaScript execution fails
+        """
+        if self.work_dir is None:
+            raise RuntimeError("Test environment not set up")
 
-            try:
-                return json.loads(stdout)  # type: ignore
-            except json.JSONDecodeError as e:
-                logger.error("Failed to parse JavaScript output: %s", stdout)
-                raise RuntimeError("Invalid JSON output from JavaScript") from e
+        node_path = shutil.which("node")
+        if node_path is None:
+            raise RuntimeError("node executable not found")
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to run JavaScript tests: {e}") from e
+        with JSRunner(node_path, self.work_dir, DP_JS_PATH) as runner:
+            return runner.run(test_cases)
 
-    def _run_python_tests(self, test_cases: list[TestCase]) -> list[JSResult]:
+    def _run_python_tests(self, test_cases: TestCases) -> Results:
         """Run test cases through Python implementation.
 
+        The lookup tables behind pi(), emc() and mold() are evaluated for all
+        test cases at once, using the same boundary handling as the scalar
+        functions (mold risk is 0 outside the mold table).
+
         Args:
-            test_cases: List of [temperature, relative_humidity] pairs
+            test_cases: (N, 2) array of [temperature, relative_humidity] pairs
 
         Returns:
-            List of results from Python implementation
+            Results from Python implementation
         """
-        return [
-            {
-                "temp": t,
-                "rh": rh,
-                "pi": pi(t, rh),
-                "emc": emc(t, rh),
-                "mold": mold(t, rh),
-            }
-            for t, rh in test_cases
-        ]
+        results = np.empty(len(test_cases), dtype=RESULT_DTYPE)
+        results["temp"] = test_cases[:, 0]
+        results["rh"] = test_cases[:, 1]
+        results["pi"] = pi_table.lookup_array(results["temp"], results["rh"])
+        results["emc"] = emc_table.lookup_array(results["temp"], results["rh"])
+        results["mold"] = mold_table.lookup_array(
+            results["temp"], results["rh"], fill_value=0
+        )
+        return results
 
     def _compare_results(
-        self, js_results: list[JSResult], py_results: list[JSResult]
+        self, js_results: Results, py_results: Results
     ) -> dict[str, list[ValidationDifference]]:
         """Compare JavaScript and Python results.
 
@@ -443,52 +825,63 @@ class ValidationTest:
 
         Returns:
             Dictionary with function names as keys and lists of differences
-        """
-        differences: dict[str, list[ValidationDifference]] = {
-            "pi": [],
-            "emc": [],
-            "mold": [],
-        }
 
-        for js, py in zip(js_results, py_results, strict=False):
-            t, rh = js["temp"], js["rh"]
-
-            # Compare PI values
-            if js["pi"] != py["pi"]:
-                differences["pi"].append(
-                    ValidationDifference(t, rh, js["pi"], py["pi"])
-                )
+        Raises:
+            ValueError: If the number of results differ
+        """
+        if js_results.shape != py_results.shape:
+            raise ValueError(
+                f"Result count mismatch: JS={js_results.size}, "
+                f"Python={py_results.size}"
+            )
 
-            # Compare EMC values (with tolerance)
-            if abs(js["emc"] - py["emc"]) > ComparisonConfig.emc_tolerance:
-                differences["emc"].append(
-                    ValidationDifference(t, rh, js["emc"], py["emc"])
+        # Fast path for the common case where all results match
+        if (
+            np.array_equal(js_results["pi"], py_results["pi"])
+            and np.array_equal(js_results["mold"], py_results["mold"])
+            and np.all(
+                np.abs(js_results["emc"] - py_results["emc"])
+                <= ComparisonConfig.emc_tolerance
+            )
+        ):
+            return {"pi": [], "emc": [], "mold": []}
+
+        differences: dict[str, list[ValidationDifference]] = {}
+        for func in ("pi", "emc", "mold"):
+            # Compare EMC values with tolerance, PI and mold values exactly
+            if func == "emc":
+                mask = (
+                    np.abs(js_results["emc"] - py_results["emc"])
+                    > ComparisonConfig.emc_tolerance
                 )
-
-            # Compare Mold values
-            if js["mold"] != py["mold"]:
-                differences["mold"].append(
-                    ValidationDifference(t, rh, js["mold"], py["mold"])
+            else:
+                mask = js_results[func] != py_results[func]
+
+            # Only build differences for mismatching cases
+            differences[func] = [
+                ValidationDifference(t, rh, js_value, py_value)
+                for t, rh, js_value, py_value in zip(
+                    js_results["temp"][mask].tolist(),
+                    js_results["rh"][mask].tolist(),
+                    js_results[func][mask].tolist(),
+                    py_results[func][mask].tolist(),
+                    strict=True,
                 )
+            ]
 
         return differences
 
     @staticmethod
     def _check_node_installation() -> None:
-        """Check if Node.js and npm are available.
+        """Check if Node.js is available.
 
         Raises:
-            RuntimeError: If Node.js or npm is not installed
+            RuntimeError: If Node.js is not installed
         """
-        npm_path = shutil.which("npm")
-        if npm_path is None:
-            raise RuntimeError("npm executable not found")
-
         node_path = shutil.which("node")
         if node_path is None:
             raise RuntimeError("node executable not found")
         try:
-            # Check Node.js
             node_version = subprocess.run(  # noqa: S603
                 [node_path, "--version"],
                 capture_output=True,
@@ -497,19 +890,10 @@ class ValidationTest:
             )
             logger.debug("Found Node.js: %s", node_version.stdout.strip())
 
-            # Check npm
-            npm_version = subprocess.run(  # noqa: S603
-                [npm_path, "--version"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            logger.debug("Found npm: %s", npm_version.stdout.strip())
-
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             raise RuntimeError(
-                "Node.js and npm are required but not found. "
-                "Please install them from https://nodejs.org/"
+                "Node.js is required but not found. "
+                "Please install it from https://nodejs.org/"
             ) from e
 
 
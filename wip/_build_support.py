@@ -0,0 +1,118 @@
+"""Build support for the preservationeval setup script.
+
+Holds the custom ``build_py`` command that generates the
+``preservationeval.tables`` module before the regular build runs.
+"""
+
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from setuptools.command.build_py import build_py
+
+# Logging is configured by the entry-point scripts (setup.py, build.py), so
+# importing this module has no side effects on their log output
+logger = logging.getLogger(__name__)
+
+# Colour the build messages only on a terminal, not in CI logs
+_COLOR = sys.stderr.isatty()
+BLUE = "\033[94m" if _COLOR else ""
+GREEN = "\033[92m" if _COLOR else ""
+RESET = "\033[0m" if _COLOR else ""
+
+# The setup script lives in wip/, the package sources in the repository root
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+TABLES_MODULE_PATH = SRC_PATH / "preservationeval" / "tables.py"
+GENERATOR_PATH = SRC_PATH / "preservationeval" / "install"
+SKIP_TABLE_BUILD_ENV = "PRESERVATIONEVAL_SKIP_TABLE_BUILD"
+
+# Fixed package layout under SRC_PATH, listed explicitly so setup.py does not
+# have to walk the source tree. CI checks it against find_packages().
+PACKAGES = [
+    "preservationeval",
+    "preservationeval.install",
+    "preservationeval.types",
+    "preservationeval.utils",
+    "preservationeval.utils.logging",
+]
+
+
+@contextmanager
+def prepend_syspath(*paths: Path) -> Iterator[None]:
+    """Temporarily put paths first on sys.path.
+
+    Paths that are already on sys.path are left where they are. The added
+    paths are removed again when the context exits, also on errors. The
+    first path given ends up first on sys.path.
+
+    Args:
+        paths: Directories to make importable
+    """
+    added = [str(path) for path in paths if str(path) not in sys.path]
+    for path in reversed(added):
+        sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        for path in added:
+            sys.path.remove(path)
+
+
+def tables_up_to_date() -> bool:
+    """Check whether the tables module is newer than its generator.
+
+    The tables module serves as its own stamp: it is up to date if it was
+    written after the last change to any generator source.
+
+    Returns:
+        True if the tables module exists and needs no regeneration
+    """
+    if not TABLES_MODULE_PATH.is_file():
+        return False
+    tables_mtime = TABLES_MODULE_PATH.stat().st_mtime
+    return all(
+        source.stat().st_mtime < tables_mtime for source in GENERATOR_PATH.glob("*.py")
+    )
+
+
+class TableBuildCommand(build_py):
+    """Build command that generates lookup tables before building."""
+
+    def _generate_tables(self) -> None:
+        """Generate the preservationeval.tables module."""
+        try:
+            with prepend_syspath(SRC_PATH):
+                import requests
+
+                from preservationeval.install.generate_tables import (
+                    generate_tables,
+                )
+
+                with requests.Session() as session:
+                    generate_tables(session=session)
+        except Exception as e:
+            logger.error(f"Error generating preservationeval.tables: {e}")
+            raise  # This will cause the build to fail
+
+    def run(self) -> None:
+        """Run the build command with table generation.
+
+        This command performs the following steps:
+        1. Generates preservation lookup tables (PI, EMC, Mold), unless they
+           are newer than the generator or PRESERVATIONEVAL_SKIP_TABLE_BUILD=1
+           is set
+        2. Runs standard build process
+        """
+        if os.environ.get(SKIP_TABLE_BUILD_ENV) == "1" or tables_up_to_date():
+            logger.info("preservationeval.tables is up to date, skipping")
+            build_py.run(self)
+            return
+        self.execute(
+            self._generate_tables,
+            (),
+            msg=f"{BLUE}Generating preservationeval.tables module.{RESET}",
+        )
+        build_py.run(self)
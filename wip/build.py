@@ -2,6 +2,7 @@
 
 import logging
 
+from _build_support import BLUE, GREEN, RESET
 from setuptools.build_meta import *
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s: %(message)s")
@@ -12,9 +13,9 @@ def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     try:
         from preservationeval.install.generate_tables import generate_tables
 
-        logger.debug("\033[94m" "Generating preservation lookup tables..." "\033[0m")
+        logger.debug("%sGenerating preservation lookup tables...%s", BLUE, RESET)
         generate_tables()
-        logger.debug("\033[92m" "Table generation completed successfully" "\033[0m")
+        logger.debug("%sTable generation completed successfully%s", GREEN, RESET)
 
         # Call the original build_wheel function
         return __build_wheel(wheel_directory, config_settings, metadata_directory)